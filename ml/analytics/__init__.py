@@ -8,5 +8,4 @@ Core analytics functions for agricultural intelligence system
 __version__ = '1.0.0'
 __author__ = 'Eliabu - African Intelligence Company'
 
-# Don't import anything here - let users import directly
-print(f"✅ Analytics Module v{__version__} loaded!")
\ No newline at end of file
+# Don't import anything here - let users import directly
\ No newline at end of file
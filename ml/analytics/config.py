@@ -8,7 +8,7 @@ from pathlib import Path
 
 
 # Base directory (ml/analytics/)
-BASE_DIR = Path(__file__).resolve().parent
+BASE_DIR = Path(__file__).parent
 
 # Project root (ml/)
 ML_DIR = BASE_DIR.parent
@@ -153,4 +153,7 @@ CURRENCY_SYMBOL = 'TZS'
 MIN_DATA_POINTS = 10  # Minimum records needed for analysis
 MAX_MISSING_PCT = 20  # Maximum % of missing data allowed
 
-print("Analytics configuration loaded")
\ No newline at end of file
+# RESULT CACHING
+
+# Seconds an analytics result is reused before it is recomputed
+RESULT_CACHE_TTL_SECONDS = 300
@@ -7,17 +7,32 @@ Validation rules for maize intelligence data
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from config import (
     REGIONS, MARKETS, QUALITY_GRADES,
-    PRICE_MIN_NORMAL, PRICE_MAX_NORMAL
+    PRICE_MIN_NORMAL, PRICE_MAX_NORMAL, MAX_MISSING_PCT
 )
 
+# Numba is optional - kernels fall back to numpy when it is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ============================================================================
 # VALIDATION UTILITIES
 # ============================================================================
 
+# String columns read as categoricals so isin/unique/isna work on integer codes.
+# Categories are inferred from the file, so unexpected values are kept for the domain checks.
+CATEGORICAL_COLUMNS = {
+    'region': 'category',
+    'market': 'category',
+    'quality_grade': 'category',
+    'warehouse_id': 'category'
+}
+
 class ValidationResult:
     """Store validation results"""
     
@@ -51,16 +66,70 @@ class ValidationResult:
             'info': self.info
         }
 
+def _sign_counts_numpy(values):
+    """Count negative and zero entries of a float array (NaN is neither)"""
+    return int((values < 0).sum()), int((values == 0).sum())
+
+if njit is not None:
+    @njit(cache=True)
+    def _sign_counts(values):
+        """Count negative and zero entries of a float array (NaN is neither)"""
+        negative = 0
+        zero = 0
+        for value in values:
+            if value < 0:
+                negative += 1
+            elif value == 0:
+                zero += 1
+        return negative, zero
+else:
+    _sign_counts = _sign_counts_numpy
+
+def _column_sign_counts(series: pd.Series) -> Tuple[int, int]:
+    """
+    Count negative and zero values of a numeric column in one pass
+    
+    Args:
+        series: Numeric column
+    
+    Returns:
+        tuple: (negative_count, zero_count)
+    """
+    return _sign_counts(series.to_numpy(dtype='float64'))
+
+# Missing-value share (%) above which a column gets a warning
+MISSING_WARNING_PCT = 5
+
+def _report_missing(result: ValidationResult, df: pd.DataFrame):
+    """
+    Add a warning or error for every column with too many missing values
+    
+    Args:
+        result: ValidationResult to add messages to
+        df: Dataframe being validated
+    """
+    pct = df.isna().sum().to_numpy() / len(df) * 100.0
+    # 0: <= warning threshold, 1: warning, 2: above MAX_MISSING_PCT
+    levels = np.digitize(pct, [MISSING_WARNING_PCT, MAX_MISSING_PCT], right=True)
+    
+    for i in np.flatnonzero(levels):
+        message = f"Column '{df.columns[i]}' has {pct[i]:.1f}% missing values"
+        if levels[i] == 2:
+            result.add_error(message)
+        else:
+            result.add_warning(message)
+
 # ============================================================================
 # PRODUCTION DATA VALIDATION
 # ============================================================================
 
-def validate_production_data(df: pd.DataFrame) -> ValidationResult:
+def validate_production_data(df: pd.DataFrame, now: Optional[datetime] = None) -> ValidationResult:
     """
     Validate maize production data
     
     Args:
         df: Production dataframe
+        now: Reference time for the future-date check (defaults to datetime.now())
     
     Returns:
         ValidationResult object
@@ -75,10 +144,10 @@ def validate_production_data(df: pd.DataFrame) -> ValidationResult:
     
     # Check required columns
     required_columns = ['date', 'region', 'quantity_tons']
-    missing_columns = set(required_columns) - set(df.columns)
+    missing_columns = pd.Index(required_columns).difference(df.columns)
     
-    if missing_columns:
-        result.add_error(f"Missing required columns: {missing_columns}")
+    if len(missing_columns) > 0:
+        result.add_error(f"Missing required columns: {set(missing_columns)}")
         return result
     
     # Validate date column
@@ -89,7 +158,9 @@ def validate_production_data(df: pd.DataFrame) -> ValidationResult:
         return result
     
     # Check for future dates
-    future_dates = df[df['date'] > datetime.now()]
+    if now is None:
+        now = datetime.now()
+    future_dates = df[df['date'] > now]
     if len(future_dates) > 0:
         result.add_warning(f"{len(future_dates)} records have future dates")
     
@@ -100,34 +171,28 @@ def validate_production_data(df: pd.DataFrame) -> ValidationResult:
         result.add_error(f"Invalid regions found: {unique_invalid.tolist()}")
     
     # Validate quantity_tons
-    if (df['quantity_tons'] < 0).any():
-        negative_count = (df['quantity_tons'] < 0).sum()
+    negative_count, zero_count = _column_sign_counts(df['quantity_tons'])
+    if negative_count > 0:
         result.add_error(f"{negative_count} records have negative quantities")
     
-    if (df['quantity_tons'] == 0).any():
-        zero_count = (df['quantity_tons'] == 0).sum()
+    if zero_count > 0:
         result.add_warning(f"{zero_count} records have zero quantities")
     
-    # Check for extreme values (outliers)
-    q1 = df['quantity_tons'].quantile(0.25)
-    q3 = df['quantity_tons'].quantile(0.75)
-    iqr = q3 - q1
-    lower_bound = q1 - 3 * iqr
-    upper_bound = q3 + 3 * iqr
-    
-    outliers = df[(df['quantity_tons'] < lower_bound) | (df['quantity_tons'] > upper_bound)]
-    if len(outliers) > 0:
-        result.add_warning(f"{len(outliers)} potential outliers detected (extreme values)")
+    # Check for extreme values (outliers) - both quartiles from one call, NaNs ignored
+    # (an all-missing column has no quartiles and is reported by _report_missing)
+    quantities = df['quantity_tons'].to_numpy(dtype='float64')
+    if not np.isnan(quantities).all():
+        q1, q3 = np.nanquantile(quantities, [0.25, 0.75])
+        iqr = q3 - q1
+        lower_bound = q1 - 3 * iqr
+        upper_bound = q3 + 3 * iqr
+        
+        outlier_count = int(((quantities < lower_bound) | (quantities > upper_bound)).sum())
+        if outlier_count > 0:
+            result.add_warning(f"{outlier_count} potential outliers detected (extreme values)")
     
     # Check for missing values
-    missing_summary = df.isnull().sum()
-    for col, count in missing_summary.items():
-        if count > 0:
-            pct = (count / len(df)) * 100
-            if pct > 20:
-                result.add_error(f"Column '{col}' has {pct:.1f}% missing values")
-            elif pct > 5:
-                result.add_warning(f"Column '{col}' has {pct:.1f}% missing values")
+    _report_missing(result, df)
     
     # Info messages
     result.add_info(f"Total records: {len(df)}")
@@ -141,12 +206,13 @@ def validate_production_data(df: pd.DataFrame) -> ValidationResult:
 # PRICE DATA VALIDATION
 # ============================================================================
 
-def validate_price_data(df: pd.DataFrame) -> ValidationResult:
+def validate_price_data(df: pd.DataFrame, now: Optional[datetime] = None) -> ValidationResult:
     """
     Validate maize price data
     
     Args:
         df: Price dataframe
+        now: Reference time for the future-date check (defaults to datetime.now())
     
     Returns:
         ValidationResult object
@@ -161,10 +227,10 @@ def validate_price_data(df: pd.DataFrame) -> ValidationResult:
     
     # Check required columns
     required_columns = ['date', 'market', 'price_per_kg_tzs', 'quality_grade']
-    missing_columns = set(required_columns) - set(df.columns)
+    missing_columns = pd.Index(required_columns).difference(df.columns)
     
-    if missing_columns:
-        result.add_error(f"Missing required columns: {missing_columns}")
+    if len(missing_columns) > 0:
+        result.add_error(f"Missing required columns: {set(missing_columns)}")
         return result
     
     # Validate date column
@@ -175,7 +241,9 @@ def validate_price_data(df: pd.DataFrame) -> ValidationResult:
         return result
     
     # Check for future dates
-    future_dates = df[df['date'] > datetime.now()]
+    if now is None:
+        now = datetime.now()
+    future_dates = df[df['date'] > now]
     if len(future_dates) > 0:
         result.add_warning(f"{len(future_dates)} records have future dates")
     
@@ -192,9 +260,9 @@ def validate_price_data(df: pd.DataFrame) -> ValidationResult:
         result.add_error(f"Invalid quality grades found: {unique_invalid.tolist()}")
     
     # Validate price_per_kg_tzs
-    if (df['price_per_kg_tzs'] <= 0).any():
-        negative_count = (df['price_per_kg_tzs'] <= 0).sum()
-        result.add_error(f"{negative_count} records have non-positive prices")
+    negative_count, zero_count = _column_sign_counts(df['price_per_kg_tzs'])
+    if negative_count + zero_count > 0:
+        result.add_error(f"{negative_count + zero_count} records have non-positive prices")
     
     # Check for unrealistic prices
     too_low = df[df['price_per_kg_tzs'] < PRICE_MIN_NORMAL]
@@ -206,26 +274,19 @@ def validate_price_data(df: pd.DataFrame) -> ValidationResult:
         result.add_warning(f"{len(too_high)} records have unusually high prices (> {PRICE_MAX_NORMAL} TZS)")
     
     # Check grade price hierarchy (Grade A should be >= Grade B >= Grade C)
-    for market in df['market'].unique():
-        market_data = df[df['market'] == market].groupby('quality_grade')['price_per_kg_tzs'].mean()
-        
-        if 'A' in market_data.index and 'B' in market_data.index:
-            if market_data['A'] < market_data['B']:
-                result.add_warning(f"{market}: Grade A price lower than Grade B (unusual)")
-        
-        if 'B' in market_data.index and 'C' in market_data.index:
-            if market_data['B'] < market_data['C']:
-                result.add_warning(f"{market}: Grade B price lower than Grade C (unusual)")
+    grade_means = df.groupby(['market', 'quality_grade'], observed=True, sort=False)['price_per_kg_tzs'].mean().unstack('quality_grade')
+    grade_means = grade_means.reindex(index=df['market'].dropna().unique(), columns=QUALITY_GRADES)
+    a_below_b = (grade_means['A'] < grade_means['B']).to_numpy()
+    b_below_c = (grade_means['B'] < grade_means['C']).to_numpy()
+    
+    for market, a_low, b_low in zip(grade_means.index, a_below_b, b_below_c):
+        if a_low:
+            result.add_warning(f"{market}: Grade A price lower than Grade B (unusual)")
+        if b_low:
+            result.add_warning(f"{market}: Grade B price lower than Grade C (unusual)")
     
     # Check for missing values
-    missing_summary = df.isnull().sum()
-    for col, count in missing_summary.items():
-        if count > 0:
-            pct = (count / len(df)) * 100
-            if pct > 20:
-                result.add_error(f"Column '{col}' has {pct:.1f}% missing values")
-            elif pct > 5:
-                result.add_warning(f"Column '{col}' has {pct:.1f}% missing values")
+    _report_missing(result, df)
     
     # Info messages
     result.add_info(f"Total records: {len(df)}")
@@ -259,10 +320,10 @@ def validate_storage_data(df: pd.DataFrame) -> ValidationResult:
     
     # Check required columns
     required_columns = ['date', 'warehouse_id', 'quantity_stored_tons', 'capacity_tons']
-    missing_columns = set(required_columns) - set(df.columns)
+    missing_columns = pd.Index(required_columns).difference(df.columns)
     
-    if missing_columns:
-        result.add_error(f"Missing required columns: {missing_columns}")
+    if len(missing_columns) > 0:
+        result.add_error(f"Missing required columns: {set(missing_columns)}")
         return result
     
     # Validate date column
@@ -273,14 +334,14 @@ def validate_storage_data(df: pd.DataFrame) -> ValidationResult:
         return result
     
     # Validate quantity_stored_tons
-    if (df['quantity_stored_tons'] < 0).any():
-        negative_count = (df['quantity_stored_tons'] < 0).sum()
+    negative_count, _ = _column_sign_counts(df['quantity_stored_tons'])
+    if negative_count > 0:
         result.add_error(f"{negative_count} records have negative storage quantities")
     
     # Validate capacity_tons
-    if (df['capacity_tons'] <= 0).any():
-        invalid_count = (df['capacity_tons'] <= 0).sum()
-        result.add_error(f"{invalid_count} records have non-positive capacity")
+    negative_count, zero_count = _column_sign_counts(df['capacity_tons'])
+    if negative_count + zero_count > 0:
+        result.add_error(f"{negative_count + zero_count} records have non-positive capacity")
     
     # Check if stored quantity exceeds capacity
     overstocked = df[df['quantity_stored_tons'] > df['capacity_tons']]
@@ -300,14 +361,7 @@ def validate_storage_data(df: pd.DataFrame) -> ValidationResult:
         result.add_info(f"Active warehouses: {warehouse_count}")
     
     # Check for missing values
-    missing_summary = df.isnull().sum()
-    for col, count in missing_summary.items():
-        if count > 0:
-            pct = (count / len(df)) * 100
-            if pct > 20:
-                result.add_error(f"Column '{col}' has {pct:.1f}% missing values")
-            elif pct > 5:
-                result.add_warning(f"Column '{col}' has {pct:.1f}% missing values")
+    _report_missing(result, df)
     
     # Info messages
     result.add_info(f"Total records: {len(df)}")
@@ -347,26 +401,30 @@ def validate_forecast_data(df: pd.DataFrame, forecast_type: str = 'production')
     else:  # price
         required_columns = ['month', 'yhat', 'yhat_lower', 'yhat_upper', 'market', 'grade']
     
-    missing_columns = set(required_columns) - set(df.columns)
+    missing_columns = pd.Index(required_columns).difference(df.columns)
     
-    if missing_columns:
-        result.add_error(f"Missing required columns: {missing_columns}")
+    if len(missing_columns) > 0:
+        result.add_error(f"Missing required columns: {set(missing_columns)}")
         return result
     
     # Validate predictions are positive
-    if (df['yhat'] < 0).any():
-        negative_count = (df['yhat'] < 0).sum()
+    negative_count, _ = _column_sign_counts(df['yhat'])
+    if negative_count > 0:
         result.add_error(f"{negative_count} forecasts have negative values")
     
-    # Validate confidence intervals
-    invalid_ci = df[df['yhat_lower'] > df['yhat_upper']]
-    if len(invalid_ci) > 0:
-        result.add_error(f"{len(invalid_ci)} forecasts have invalid confidence intervals (lower > upper)")
+    # Validate confidence intervals (counted on raw arrays - no row copies)
+    yhat = df['yhat'].to_numpy()
+    lower = df['yhat_lower'].to_numpy()
+    upper = df['yhat_upper'].to_numpy()
+    
+    invalid_ci = int((lower > upper).sum())
+    if invalid_ci > 0:
+        result.add_error(f"{invalid_ci} forecasts have invalid confidence intervals (lower > upper)")
     
     # Check if forecast is within confidence interval
-    outside_ci = df[(df['yhat'] < df['yhat_lower']) | (df['yhat'] > df['yhat_upper'])]
-    if len(outside_ci) > 0:
-        result.add_warning(f"{len(outside_ci)} forecasts fall outside their own confidence intervals")
+    outside_ci = int(((yhat < lower) | (yhat > upper)).sum())
+    if outside_ci > 0:
+        result.add_warning(f"{outside_ci} forecasts fall outside their own confidence intervals")
     
     # Info messages
     result.add_info(f"Total forecasts: {len(df)}")
@@ -384,6 +442,31 @@ def validate_forecast_data(df: pd.DataFrame, forecast_type: str = 'production')
 # BATCH VALIDATION
 # ============================================================================
 
+def _read_dataset_csv(path) -> pd.DataFrame:
+    """
+    Read a dataset CSV for validation
+    
+    Uses pyarrow's multi-threaded parser when it is installed, with dates
+    typed at parse time and string columns read as dictionaries
+    (categoricals); falls back to pandas otherwise.
+    
+    Args:
+        path: CSV file path
+    
+    Returns:
+        pd.DataFrame: Parsed dataset
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(path, dtype=CATEGORICAL_COLUMNS)
+    
+    column_types = {'date': pa.timestamp('ns')}
+    column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORICAL_COLUMNS})
+    table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=column_types))
+    return table.to_pandas()
+
 def validate_all_data() -> Dict[str, ValidationResult]:
     """
     Validate all datasets
@@ -395,11 +478,12 @@ def validate_all_data() -> Dict[str, ValidationResult]:
     from config import PRODUCTION_DATA, PRICE_DATA, STORAGE_DATA
     
     results = {}
+    now = datetime.now()
     
     # Validate production data
     try:
-        prod_df = pd.read_csv(PRODUCTION_DATA)
-        results['production'] = validate_production_data(prod_df)
+        prod_df = _read_dataset_csv(PRODUCTION_DATA)
+        results['production'] = validate_production_data(prod_df, now)
     except Exception as e:
         result = ValidationResult()
         result.add_error(f"Failed to load production data: {str(e)}")
@@ -407,8 +491,8 @@ def validate_all_data() -> Dict[str, ValidationResult]:
     
     # Validate price data
     try:
-        price_df = pd.read_csv(PRICE_DATA)
-        results['price'] = validate_price_data(price_df)
+        price_df = _read_dataset_csv(PRICE_DATA)
+        results['price'] = validate_price_data(price_df, now)
     except Exception as e:
         result = ValidationResult()
         result.add_error(f"Failed to load price data: {str(e)}")
@@ -416,7 +500,7 @@ def validate_all_data() -> Dict[str, ValidationResult]:
     
     # Validate storage data
     try:
-        storage_df = pd.read_csv(STORAGE_DATA)
+        storage_df = _read_dataset_csv(STORAGE_DATA)
         results['storage'] = validate_storage_data(storage_df)
     except Exception as e:
         result = ValidationResult()
@@ -1,48 +1,48 @@
+# ml/scripts/explore_data.py
+import functools
+
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load your synthetic production data
-production = pd.read_csv('../data/synthetic/maize_production.csv')
+PRODUCTION_CSV = '../data/synthetic/maize_production.csv'
 
-# Convert timestamp
-production['timestamp'] = pd.to_datetime(production['timestamp'])
 
-print("=== DATA EXPLORATION ===")
-print(f"Total records: {len(production)}")
-print(f"Date range: {production['timestamp'].min()} to {production['timestamp'].max()}")
-print(f"Unique regions: {production['region'].unique()}")
-print(f"Seasons: {production['season'].unique()}")
-print("\nSample data:")
-print(production.head())
+@functools.lru_cache(maxsize=None)
+def load_production(path=PRODUCTION_CSV):
+    """Read the production CSV once per process (callers must not mutate it)"""
+    production = pd.read_csv(path)
 
-# ml/scripts/explore_data.py
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+    # Convert timestamp
+    production['timestamp'] = pd.to_datetime(production['timestamp'])
+    return production
 
-# Load your synthetic production data
-production = pd.read_csv('../data/synthetic/maize_production.csv')
-
-# Convert timestamp
-production['timestamp'] = pd.to_datetime(production['timestamp'])
-
-print("=== DATA EXPLORATION ===")
-print(f"Total records: {len(production)}")
-print(f"Date range: {production['timestamp'].min()} to {production['timestamp'].max()}")
-print(f"Unique regions: {production['region'].unique()}")
-print(f"Seasons: {production['season'].unique()}")
-print("\nSample data:")
-print(production.head())
-
-# Plot production over time for a sample region
-plt.figure(figsize=(12, 6))
-sample_region = production['region'].unique()[0]  # First region
-region_data = production[production['region'] == sample_region]
-
-plt.plot(region_data['timestamp'], region_data['quantity_tons'], marker='o')
-plt.title(f'Maize Production in {sample_region}')
-plt.xlabel('Date')
-plt.ylabel('Production (tons)')
-plt.grid(True, alpha=0.3)
-plt.show()
\ No newline at end of file
+
+def explore(path=PRODUCTION_CSV):
+    """Print a summary of the production data and plot one region"""
+    production = load_production(path)
+
+    print("=== DATA EXPLORATION ===")
+    print(f"Total records: {len(production)}")
+    print(f"Date range: {production['timestamp'].min()} to {production['timestamp'].max()}")
+    print(f"Unique regions: {production['region'].unique()}")
+    print(f"Seasons: {production['season'].unique()}")
+    print("\nSample data:")
+    print(production.head())
+
+    # Plot production over time for a sample region
+    plt.figure(figsize=(12, 6))
+    sample_region = production['region'].unique()[0]  # First region
+    region_data = production[production['region'] == sample_region]
+
+    plt.plot(region_data['timestamp'], region_data['quantity_tons'], marker='o')
+    plt.title(f'Maize Production in {sample_region}')
+    plt.xlabel('Date')
+    plt.ylabel('Production (tons)')
+    plt.grid(True, alpha=0.3)
+    plt.show()
+
+
+if __name__ == '__main__':
+    explore()
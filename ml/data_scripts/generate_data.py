@@ -1,11 +1,13 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
 
-# Set random seeds for reproducibility
-np.random.seed(42)
-random.seed(42)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Single seeded generator for all random draws (reproducible output)
+rng = np.random.default_rng(42)
 
 print(" MAIZE SYNTHETIC DATA GENERATOR")
 print("=================================")
@@ -20,6 +22,13 @@ REGIONS = {
 # All regions flattened
 ALL_REGIONS = [region for categories in REGIONS.values() for region in categories]
 
+# Region -> production category
+REGION_TO_CATEGORY = {region: category for category, regions in REGIONS.items() for region in regions}
+
+# Warehouse code (first 3 letters) -> region
+CODE_TO_REGION = {region[:3].upper(): region for region in ALL_REGIONS}
+assert len(CODE_TO_REGION) == len(ALL_REGIONS), "regions must have unique 3-letter codes"
+
 # Markets (at least one per region, major cities have 2)
 MARKETS = {
     "Dar es Salaam": ["Kariakoo", "Mwenge"],
@@ -47,10 +56,7 @@ for region in ALL_REGIONS:
 # ===== 2. HELPER FUNCTIONS =====
 def get_region_category(region):
     """Return if region is High, Medium, or Low production"""
-    for category, regions in REGIONS.items():
-        if region in regions:
-            return category
-    return "Medium"
+    return REGION_TO_CATEGORY.get(region, "Medium")
 
 def monthly_price_modifier(month):
     """Monthly price modifiers from strategy doc"""
@@ -84,204 +90,159 @@ def grade_multiplier(grade):
     multipliers = {"A": 1.20, "B": 1.00, "C": 0.85}
     return multipliers.get(grade, 1.0)
 
+# Lookup tables built from the helpers: MONTH_MOD[month], DOW_MOD[weekday], GRADE_MOD[grade index]
+MONTH_MOD = np.array([1.0] + [monthly_price_modifier(month) for month in range(1, 13)])
+DOW_MOD = np.array([day_of_week_modifier(weekday) for weekday in range(7)])
+GRADE_MOD = np.array([grade_multiplier(grade) for grade in GRADES])
+
+def walk_storage(capacities, init_stock, months, draws):
+    """Weekly stock of every warehouse (one row per week), from uniform [0, 1) draws"""
+    stock = init_stock.copy()
+    levels = np.empty((len(months), len(capacities)))
+    for week in range(len(months)):
+        month = months[week]
+        for i in range(len(capacities)):
+            u = draws[week, i]
+            if month == 8 or month == 9 or month == 3:  # Post-harvest months
+                # Increase stock
+                weekly_change = 0.05 + (0.15 - 0.05) * u
+            elif month == 4 or month == 5 or month == 11:  # Lean season months
+                # Decrease stock
+                weekly_change = -(0.03 + (0.08 - 0.03) * u)
+            else:
+                weekly_change = -0.02 + (0.02 - -0.02) * u
+            
+            # Apply weekly change, keeping stock within bounds
+            stock[i] = max(0.0, min(capacities[i], stock[i] * (1 + weekly_change)))
+            levels[week, i] = stock[i]
+    return levels
+
+if njit is not None:
+    walk_storage = njit(cache=True)(walk_storage)
+
 # ===== 3. GENERATE PRODUCTION DATA =====
 print("\n1. Generating production data...")
 
-production_data = []
-production_id = 1
-
-for year in [2023, 2024]:
-    for region in ALL_REGIONS:
-        region_category = get_region_category(region)
-        
-        # Regional modifier
-        regional_mod = {"High": 1.5, "Medium": 1.0, "Low": 0.4}[region_category]
-        
-        # Masika season (harvest May-July)
-        for harvest_month in [5, 6, 7]:
-            date = datetime(year, harvest_month, 1)
-            season = "Masika"
-            base_yield = 500  # tons for Medium region, Masika
-            
-            # Calculate with seasonal modifier (Masika 1.8x, Vuli 1.0x)
-            quantity = base_yield * regional_mod * 1.8 * random.uniform(0.9, 1.1)
-            farm_area = quantity / random.uniform(3.5, 4.5)  # Yield 3.5-4.5 tons/hectare
-            
-            production_data.append({
-                "id": production_id,
-                "date": date.strftime("%Y-%m-%d"),
-                "region": region,
-                "season": season,
-                "quantity_tons": round(quantity, 2),
-                "farm_area_hectares": round(farm_area, 2)
-            })
-            production_id += 1
-        
-        # Vuli season (harvest Dec-Feb)
-        for harvest_month in [12, 1, 2]:
-            if harvest_month == 12:
-                date = datetime(year, harvest_month, 1)
-            else:  # Jan/Feb of next year
-                date = datetime(year + 1, harvest_month, 1)
-            
-            season = "Vuli"
-            base_yield = 500  # tons for Medium region, Vuli is smaller
-            
-            quantity = base_yield * regional_mod * 1.0 * random.uniform(0.9, 1.1)
-            farm_area = quantity / random.uniform(3.5, 4.5)
-            
-            production_data.append({
-                "id": production_id,
-                "date": date.strftime("%Y-%m-%d"),
-                "region": region,
-                "season": season,
-                "quantity_tons": round(quantity, 2),
-                "farm_area_hectares": round(farm_area, 2)
-            })
-            production_id += 1
-
-df_production = pd.DataFrame(production_data)
+PRODUCTION_YEARS = [2023, 2024]
+MASIKA_MONTHS = [5, 6, 7]
+VULI_MONTHS = [12, 1, 2]
+
+BASE_YIELD = 500  # tons for Medium region, before the seasonal modifier
+
+# One record per year x region x harvest month, in the same order as the draws below
+records = pd.MultiIndex.from_product(
+    [PRODUCTION_YEARS, ALL_REGIONS, MASIKA_MONTHS + VULI_MONTHS], names=["year", "region", "month"]
+).to_frame(index=False)
+n_production = len(records)
+
+# Yield noise and tons/hectare for every record, drawn in one go
+quantity_noise = rng.uniform(0.9, 1.1, size=n_production)
+yield_per_hectare = rng.uniform(3.5, 4.5, size=n_production)
+
+# Masika harvests May-July, Vuli Dec-Feb (Jan/Feb of the next year)
+is_masika = records["month"].isin(MASIKA_MONTHS).to_numpy()
+harvest_year = np.where(~is_masika & (records["month"] < 12), records["year"] + 1, records["year"])
+
+# Regional modifier and seasonal modifier (Masika 1.8x, Vuli 1.0x)
+regional_mod = records["region"].map(REGION_TO_CATEGORY).map({"High": 1.5, "Medium": 1.0, "Low": 0.4}).to_numpy()
+season_mod = np.where(is_masika, 1.8, 1.0)
+
+quantity = BASE_YIELD * regional_mod * season_mod * quantity_noise
+farm_area = quantity / yield_per_hectare  # Yield 3.5-4.5 tons/hectare
+
+df_production = pd.DataFrame({
+    "id": np.arange(1, n_production + 1),
+    "date": pd.to_datetime(pd.DataFrame({"year": harvest_year, "month": records["month"], "day": 1})),
+    "region": pd.Categorical(records["region"], categories=ALL_REGIONS),
+    "season": pd.Categorical(np.where(is_masika, "Masika", "Vuli"), categories=["Masika", "Vuli"]),
+    "quantity_tons": quantity.round(2),
+    "farm_area_hectares": farm_area.round(2)
+})
 print(f"   ✓ Generated {len(df_production)} production records")
 
 # ===== 4. GENERATE PRICE DATA =====
-print("\n2. Generating daily price data (this may take a moment)...")
+print("\n2. Generating daily price data...")
 
-price_data = []
-price_id = 1
-current_date = START_DATE = datetime(2023, 1, 1)
-END_DATE = datetime(2024, 12, 31)
+START_DATE = np.datetime64("2023-01-01")
+END_DATE = np.datetime64("2024-12-31")
 
 # Base price for Grade B in Medium region
 BASE_PRICE = 1500  # TZS/kg
 
-days = (END_DATE - START_DATE).days + 1
-day_count = 0
-
-while current_date <= END_DATE:
-    day_count += 1
-    if day_count % 100 == 0:
-        print(f"   Processing day {day_count}/{days}...")
-    
-    month = current_date.month
-    weekday = current_date.weekday()  # 0=Monday, 6=Sunday
-    
-    for region in ALL_REGIONS:
-        if region in MARKETS:
-            for market in MARKETS[region]:
-                for grade in GRADES:
-                    # Start with base price
-                    price = BASE_PRICE
-                    
-                    # Apply monthly seasonal modifier
-                    price *= monthly_price_modifier(month)
-                    
-                    # Apply regional premium (deficit regions +15%)
-                    if get_region_category(region) == "Low":
-                        price *= 1.15
-                    
-                    # Apply quality grade multiplier
-                    price *= grade_multiplier(grade)
-                    
-                    # Apply day-of-week effect
-                    price *= day_of_week_modifier(weekday)
-                    
-                    # Add ±2% daily random noise
-                    price *= random.uniform(0.98, 1.02)
-                    
-                    # Ensure price is reasonable (800-2500 TZS/kg)
-                    price = max(800, min(2500, price))
-                    
-                    price_data.append({
-                        "id": price_id,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "market": market,
-                        "region": region,
-                        "quality_grade": grade,
-                        "price_per_kg_tzs": round(price, 2)
-                    })
-                    price_id += 1
-    
-    current_date += timedelta(days=1)
-
-df_prices = pd.DataFrame(price_data)
+# Every day in the range, with month (1-12) and weekday (0=Monday; 1970-01-01 was a Thursday)
+dates = np.arange(START_DATE, END_DATE + 1, dtype="datetime64[D]")
+months = dates.astype("datetime64[M]").astype(int) % 12 + 1
+weekdays = (dates.view("int64") - 4) % 7
+market_regions = [(market, region) for region in ALL_REGIONS if region in MARKETS
+                  for market in MARKETS[region]]
+
+# One row per date x (market, region) x grade, dates outermost
+rows = pd.MultiIndex.from_product(
+    [range(len(dates)), range(len(market_regions)), range(len(GRADES))]
+)
+date_idx, pair_idx, grade_idx = (np.asarray(level) for level in rows.codes)
+
+# Per-date and per-market modifiers, broadcast to every row
+month_mod = MONTH_MOD[months]
+dow_mod = DOW_MOD[weekdays]
+region_mod = np.array([1.15 if get_region_category(region) == "Low" else 1.0  # Deficit regions +15%
+                       for _, region in market_regions])
+
+# ±2% daily random noise
+noise = rng.uniform(0.98, 1.02, size=len(rows))
+
+price = (BASE_PRICE * month_mod[date_idx] * region_mod[pair_idx]
+         * GRADE_MOD[grade_idx] * dow_mod[date_idx] * noise)
+
+# Ensure price is reasonable (800-2500 TZS/kg)
+price = np.clip(price, 800, 2500)
+
+# Columns built straight from the axis codes - labels stay categorical
+market_codes = pd.Categorical([market for market, _ in market_regions])
+region_codes = pd.Categorical([region for _, region in market_regions])
+
+df_prices = pd.DataFrame({
+    "id": np.arange(1, len(rows) + 1, dtype="int32"),
+    "date": dates[date_idx],
+    "market": pd.Categorical.from_codes(market_codes.codes[pair_idx], market_codes.categories),
+    "region": pd.Categorical.from_codes(region_codes.codes[pair_idx], region_codes.categories),
+    "quality_grade": pd.Categorical.from_codes(grade_idx, GRADES),
+    "price_per_kg_tzs": price.round(2).astype("float32")
+})
 print(f"   ✓ Generated {len(df_prices)} daily price records")
 
 # ===== 5. GENERATE STORAGE DATA =====
 print("\n3. Generating weekly storage data...")
 
-storage_data = []
-storage_id = 1
-
-# Assign capacities to warehouses
-warehouse_capacities = {}
-for warehouse in WAREHOUSES:
-    # Extract region from warehouse ID
-    region_code = warehouse.split('-')[1]
-    # Simple mapping back to region
-    for region in ALL_REGIONS:
-        if region[:3].upper() == region_code:
-            warehouse_region = region
-            break
-    
-    capacity = random.randint(500, 5000)
-    warehouse_capacities[warehouse] = {
-        "capacity": capacity,
-        "region": warehouse_region,
-        "current_stock": capacity * random.uniform(0.3, 0.7)  # Start at 30-70% full
-    }
+# Assign capacities to warehouses, starting each at 30-70% full
+capacities = rng.integers(500, 5000, size=len(WAREHOUSES), endpoint=True)
+init_stock = capacities * rng.uniform(0.3, 0.7, size=len(WAREHOUSES))
 
-# Generate weekly data
-current_date = START_DATE
-while current_date <= END_DATE:
-    # Only store Monday dates (weekly)
-    if current_date.weekday() == 0:  # Monday
-        month = current_date.month
-        
-        for warehouse, info in warehouse_capacities.items():
-            region = info["region"]
-            capacity = info["capacity"]
-            current_stock = info["current_stock"]
-            
-            # Seasonal adjustment
-            month = current_date.month
-            if month in [8, 9, 3]:  # Post-harvest months
-                # Increase stock
-                weekly_change = random.uniform(0.05, 0.15)
-            elif month in [4, 5, 11]:  # Lean season months
-                # Decrease stock
-                weekly_change = -random.uniform(0.03, 0.08)
-            else:
-                weekly_change = random.uniform(-0.02, 0.02)
-            
-            # Apply weekly change
-            current_stock *= (1 + weekly_change)
-            
-            # Ensure stock is within bounds
-            current_stock = max(0, min(capacity, current_stock))
-            
-            # Update warehouse info
-            warehouse_capacities[warehouse]["current_stock"] = current_stock
-            
-            utilization = (current_stock / capacity) * 100
-            
-            storage_data.append({
-                "id": storage_id,
-                "date": current_date.strftime("%Y-%m-%d"),
-                "warehouse_id": warehouse,
-                "region": region,
-                "quantity_stored_tons": round(current_stock, 2),
-                "capacity_tons": capacity,
-                "utilization_percent": round(utilization, 1)
-            })
-            storage_id += 1
-    
-    current_date += timedelta(days=1)
-
-df_storage = pd.DataFrame(storage_data)
+# Map the region code in each warehouse ID back to its region
+warehouse_regions = [CODE_TO_REGION[warehouse.split('-')[1]] for warehouse in WAREHOUSES]
+
+# Generate weekly data (Monday dates only)
+is_monday = weekdays == 0
+mondays = dates[is_monday]
+
+# One uniform [0, 1) draw per week and warehouse
+draws = rng.random((len(mondays), len(capacities)))
+levels = walk_storage(capacities.astype(float), init_stock, months[is_monday], draws)
+
+n_warehouses = len(capacities)
+df_storage = pd.DataFrame({
+    "id": np.arange(1, levels.size + 1),
+    "date": np.repeat(mondays, n_warehouses),
+    "warehouse_id": np.tile(WAREHOUSES, len(mondays)),
+    "region": np.tile(warehouse_regions, len(mondays)),
+    "quantity_stored_tons": levels.ravel().round(2),
+    "capacity_tons": np.tile(capacities, len(mondays)),
+    "utilization_percent": ((levels / capacities) * 100).ravel().round(1)
+})
 print(f"   ✓ Generated {len(df_storage)} weekly storage records")
 
-# ===== 6. SAVE TO CSV =====
-print("\n4. Saving to CSV files...")
+# ===== 6. SAVE TO CSV AND PARQUET =====
+print("\n4. Saving to CSV and Parquet files...")
 
 # Create data directory if it doesn't exist
 import os
@@ -296,6 +257,22 @@ print("   ✓ Saved maize_production.csv")
 print("   ✓ Saved maize_prices.csv")
 print("   ✓ Saved maize_storage.csv")
 
+# Parquet copies keep real dates and store labels as dictionary-encoded categories.
+# Values are written as float64 at CSV precision; <name>.analytics.parquet and
+# maize_prices_full.parquet are the loaders' own caches and are not touched here.
+CATEGORICAL_COLUMNS = ["region", "market", "quality_grade", "season", "warehouse_id"]
+
+for name, df in [("maize_production", df_production),
+                 ("maize_prices", df_prices),
+                 ("maize_storage", df_storage)]:
+    typed = df.assign(date=pd.to_datetime(df["date"]))
+    categorical = [col for col in CATEGORICAL_COLUMNS if col in typed.columns]
+    typed[categorical] = typed[categorical].astype("category")
+    narrow = typed.select_dtypes("float32").columns
+    typed[narrow] = typed[narrow].astype("float64").round(2)
+    typed.to_parquet(f"data/{name}.parquet", compression="zstd", index=False)
+    print(f"   ✓ Saved {name}.parquet")
+
 # ===== 7. SUMMARY =====
 print("\n" + "="*50)
 print("📊 DATA GENERATION SUMMARY")
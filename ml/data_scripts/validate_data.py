@@ -5,7 +5,10 @@ print("🔍 VALIDATING GENERATED DATA")
 print("="*50)
 
 # Check files exist
-files = ["data/maize_production.csv", "data/maize_prices.csv", "data/maize_storage.csv"]
+files = [
+    "data/maize_production.csv", "data/maize_prices.csv", "data/maize_storage.csv",
+    "data/maize_production.parquet", "data/maize_prices.parquet", "data/maize_storage.parquet"
+]
 for file in files:
     if os.path.exists(file):
         size_kb = os.path.getsize(file) / 1024
@@ -19,23 +22,23 @@ print("="*50)
 # Load and summarize each file
 try:
     # Production data
-    df_prod = pd.read_csv("data/maize_production.csv")
+    df_prod = pd.read_parquet("data/maize_production.parquet")
     print(f"\n1. PRODUCTION DATA:")
     print(f"   Records: {len(df_prod)}")
     print(f"   Regions: {df_prod['region'].nunique()}")
-    print(f"   Seasons: {df_prod['season'].unique()}")
+    print(f"   Seasons: {df_prod['season'].unique().tolist()}")
     print(f"   Quantity range: {df_prod['quantity_tons'].min():.1f} to {df_prod['quantity_tons'].max():.1f} tons")
     
     # Price data
-    df_prices = pd.read_csv("data/maize_prices.csv")
+    df_prices = pd.read_parquet("data/maize_prices.parquet")
     print(f"\n2. PRICE DATA:")
     print(f"   Records: {len(df_prices):,}")
     print(f"   Markets: {df_prices['market'].nunique()}")
-    print(f"   Date range: {df_prices['date'].min()} to {df_prices['date'].max()}")
+    print(f"   Date range: {df_prices['date'].min():%Y-%m-%d} to {df_prices['date'].max():%Y-%m-%d}")
     print(f"   Price range: {df_prices['price_per_kg_tzs'].min():.0f} to {df_prices['price_per_kg_tzs'].max():.0f} TZS/kg")
     
     # Storage data
-    df_storage = pd.read_csv("data/maize_storage.csv")
+    df_storage = pd.read_parquet("data/maize_storage.parquet")
     print(f"\n3. STORAGE DATA:")
     print(f"   Records: {len(df_storage):,}")
     print(f"   Warehouses: {df_storage['warehouse_id'].nunique()}")
@@ -21,10 +21,6 @@ FORECASTS_DIR = BASE_DIR / 'forecasts' / 'production'
 VISUALIZATIONS_DIR = BASE_DIR / 'visualizations' / 'production'
 LOGS_DIR = BASE_DIR / 'logs'
 
-# Create all directories
-for directory in [DATA_DIR, MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
-
 # Model settings
 FORECAST_MONTHS = 6
 FORECAST_DAYS = FORECAST_MONTHS * 30
@@ -43,8 +39,15 @@ PROPHET_CONFIG = {
 FLOOR_MULTIPLIER = 0.3  # Floor = 30% of historical minimum
 CAP_MULTIPLIER = 2.5     # Cap = 2.5x historical maximum
 
+# Forecast file format: 'csv', or 'feather' for faster reads (needs pyarrow)
+FORECAST_FILE_FORMAT = 'csv'
+FORECAST_WRITE_WORKERS = 8  # Threads writing forecast files
+
 # Visualization settings
-FIGURE_DPI = 300
+FIGURE_DPI = 150
+FIGURE_FORMAT = 'png'
+PNG_COMPRESS_LEVEL = 1  # zlib level 0-9: faster writes, slightly larger files
+PLOT_WORKERS = os.cpu_count()  # Processes rendering the Prophet plots
 GRID_ROWS = 4
 GRID_COLS = 3
 
@@ -64,15 +67,32 @@ TANZANIA_REGIONS = [
     'Mbeya', 'Morogoro', 'Mwanza', 'Rukwa', 'Ruvuma', 'Shinyanga'
 ]
 
-# Print confirmation
-print("=" * 80)
-print("🔧 CONFIGURATION LOADED")
-print("=" * 80)
-print(f"📁 Base directory: {BASE_DIR}")
-print(f"📊 Data file: {DATA_FILE}")
-print(f"🤖 Models output: {MODELS_DIR}")
-print(f"📈 Forecasts output: {FORECASTS_DIR}")
-print(f"🎨 Visualizations output: {VISUALIZATIONS_DIR}")
-print(f"📋 Logs output: {LOGS_DIR}")
-print("=" * 80)
-print()
\ No newline at end of file
+# Initialization
+_initialized = False
+
+def _ensure_dirs():
+    """Create all output directories"""
+    for directory in [DATA_DIR, MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+def init_config():
+    """Create directories and print the configuration once per process"""
+    global _initialized
+    if _initialized:
+        return
+    
+    _ensure_dirs()
+    
+    # Print confirmation
+    print("=" * 80)
+    print("🔧 CONFIGURATION LOADED")
+    print("=" * 80)
+    print(f"📁 Base directory: {BASE_DIR}")
+    print(f"📊 Data file: {DATA_FILE}")
+    print(f"🤖 Models output: {MODELS_DIR}")
+    print(f"📈 Forecasts output: {FORECASTS_DIR}")
+    print(f"🎨 Visualizations output: {VISUALIZATIONS_DIR}")
+    print(f"📋 Logs output: {LOGS_DIR}")
+    print("=" * 80)
+    print()
+    _initialized = True
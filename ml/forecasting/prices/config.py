@@ -12,6 +12,8 @@ ML_DIR = BASE_DIR.parent.parent
 # Data directories
 DATA_DIR = ML_DIR / 'data'
 PRICE_DATA_FILE = DATA_DIR / 'maize_prices.csv'
+# Parsed copy of the full price CSV, rewritten whenever the CSV is newer
+PRICE_PARQUET_FILE = DATA_DIR / 'maize_prices_full.parquet'
 
 # Output directories
 MODELS_DIR = ML_DIR / 'models' / 'prices'
@@ -19,10 +21,6 @@ FORECASTS_DIR = ML_DIR / 'forecasts' / 'prices'
 VISUALIZATIONS_DIR = ML_DIR / 'visualizations' / 'prices'
 LOGS_DIR = ML_DIR / 'logs'
 
-# Create directories if they don't exist
-for directory in [MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
-
 # MODEL CONFIGURATION
 
 
@@ -55,14 +53,20 @@ PROPHET_PARAMS = {
     'changepoint_prior_scale': 0.05  # Control trend flexibility
 }
 
+# Stan backend (Prophet ships a precompiled CmdStan model, shared by every worker)
+STAN_BACKEND = 'CMDSTANPY'
+
 # Training configuration
 TRAIN_TEST_SPLIT = 0.8  # 80% train, 20% test
 FORECAST_DAYS = 180     # 6 months
+SAVE_PER_MODEL_FORECASTS = False  # Also write one forecast CSV per market-grade
 
 # VISUALIZATION CONFIGURATION
 
 # Plot settings
-PLOT_DPI = 300
+PLOT_DPI = 150
+PLOT_FORMAT = 'png'         # Raster format for dense plots
+VECTOR_PLOT_FORMAT = 'svg'  # Format for simple charts (no rasterization)
 PLOT_STYLE = 'seaborn-v0_8-darkgrid'
 FIGURE_SIZE_SINGLE = (14, 8)
 FIGURE_SIZE_GRID = (20, 16)
@@ -97,9 +101,12 @@ def get_forecast_filename(market: str, grade: str) -> str:
     market_slug = market.lower().replace(' ', '_')
     return f"forecast_{market_slug}_grade_{grade.lower()}.csv"
 
-def get_visualization_filename(name: str) -> str:
+# Daily forecasts for every market-grade in one long-form file
+ALL_FORECASTS_FILENAME = 'all_forecasts.csv'
+
+def get_visualization_filename(name: str, fmt: str = PLOT_FORMAT) -> str:
     """Generate visualization filename"""
-    return f"{name}.png"
+    return f"{name}.{fmt}"
 
 
 # DISPLAY SETTINGS
@@ -119,4 +126,22 @@ MIN_DATA_POINTS = 100
 # Maximum acceptable MAPE (%)
 MAX_ACCEPTABLE_MAPE = 20.0
 
-print(" Price forecasting configuration loaded!")
\ No newline at end of file
+
+# INITIALIZATION
+
+_initialized = False
+
+def _ensure_dirs():
+    """Create output directories if they don't exist"""
+    for directory in [MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+def init_config():
+    """Prepare output directories once per process (importing this module has no side effects)"""
+    global _initialized
+    if _initialized:
+        return
+    
+    _ensure_dirs()
+    print(" Price forecasting configuration loaded!")
+    _initialized = True
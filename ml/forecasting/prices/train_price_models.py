@@ -8,28 +8,42 @@ Usage:
     python train_price_models.py
 """
 
+import copy
+import os
 import pandas as pd
 import numpy as np
 import pickle
 import json
 from prophet import Prophet
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.metrics import r2_score
 import warnings
-warnings.filterwarnings('ignore')
 
 # Import configuration
 from config import (
-    PRICE_DATA_FILE, MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR,
-    MARKETS, QUALITY_GRADES, PROPHET_PARAMS, TRAIN_TEST_SPLIT, FORECAST_DAYS,
-    PLOT_DPI, COLORS, FIGURE_SIZE_GRID, CONSOLE_WIDTH,
-    get_model_filename, get_forecast_filename, get_visualization_filename,
+    PRICE_DATA_FILE, PRICE_PARQUET_FILE, MODELS_DIR, FORECASTS_DIR, VISUALIZATIONS_DIR, LOGS_DIR,
+    MARKETS, QUALITY_GRADES, PROPHET_PARAMS, STAN_BACKEND, TRAIN_TEST_SPLIT, FORECAST_DAYS, SAVE_PER_MODEL_FORECASTS,
+    PLOT_DPI, VECTOR_PLOT_FORMAT, COLORS, FIGURE_SIZE_GRID, CONSOLE_WIDTH,
+    get_model_filename, get_forecast_filename, get_visualization_filename, init_config,
+    ALL_FORECASTS_FILENAME,
     MIN_DATA_POINTS, MAX_ACCEPTABLE_MAPE, PRICE_DECIMALS
 )
 
+# Prophet output columns kept for forecasts
+FORECAST_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+# Column names used in saved forecast CSVs
+FORECAST_OUTPUT_COLUMNS = {
+    'ds': 'date',
+    'yhat': 'price_forecast',
+    'yhat_lower': 'price_lower',
+    'yhat_upper': 'price_upper'
+}
+
 # HELPER FUNCTIONS
 
 def print_header(text: str):
@@ -54,8 +68,22 @@ def load_price_data():
     if not PRICE_DATA_FILE.exists():
         raise FileNotFoundError(f"Price data not found: {PRICE_DATA_FILE}")
     
-    df = pd.read_csv(PRICE_DATA_FILE)
-    df['date'] = pd.to_datetime(df['date'])
+    df = None
+    if PRICE_PARQUET_FILE.exists() and PRICE_PARQUET_FILE.stat().st_mtime >= PRICE_DATA_FILE.stat().st_mtime:
+        try:
+            df = pd.read_parquet(PRICE_PARQUET_FILE, engine='pyarrow')
+        except (ImportError, OSError, ValueError):
+            # Missing pyarrow or unreadable file - reparse the CSV
+            df = None
+    
+    if df is None:
+        df = pd.read_csv(PRICE_DATA_FILE)
+        df['date'] = pd.to_datetime(df['date'])
+        try:
+            df.to_parquet(PRICE_PARQUET_FILE, engine='pyarrow', index=False)
+        except (ImportError, OSError):
+            # Parquet copy is an optimization only - the CSV stays the source
+            pass
     
     print(f" Loaded {len(df):,} records")
     print(f" Date range: {df['date'].min()} to {df['date'].max()}")
@@ -64,21 +92,20 @@ def load_price_data():
     
     return df
 
-def prepare_market_grade_data(df, market, grade):
-    """Filter and prepare data for specific market and grade"""
-    data = df[
-        (df['market'] == market) & 
-        (df['quality_grade'] == grade)
-    ].copy()
-    
-    # Sort by date
-    data = data.sort_values('date').reset_index(drop=True)
-    
-    # Prepare for Prophet (needs 'ds' and 'y' columns)
-    prophet_data = data[['date', 'price_per_kg_tzs']].copy()
-    prophet_data.columns = ['ds', 'y']
+def group_market_grade_data(df):
+    """Split price data into Prophet-ready frames keyed by (market, grade)"""
+    prophet_df = df[['market', 'quality_grade', 'date', 'price_per_kg_tzs']].rename(
+        columns={'date': 'ds', 'price_per_kg_tzs': 'y'}
+    )
     
-    return prophet_data
+    return {
+        key: group[['ds', 'y']].sort_values('ds').reset_index(drop=True)
+        for key, group in prophet_df.groupby(['market', 'quality_grade'], sort=False)
+    }
+
+def prepare_market_grade_data(groups, market, grade):
+    """Look up prepared data for specific market and grade"""
+    return groups.get((market, grade), pd.DataFrame(columns=['ds', 'y']))
 
 def train_test_split_data(data, split_ratio=TRAIN_TEST_SPLIT):
     """Split data into train and test sets"""
@@ -87,47 +114,63 @@ def train_test_split_data(data, split_ratio=TRAIN_TEST_SPLIT):
     test = data[split_idx:].copy()
     return train, test
 
+_MODEL_TEMPLATE = None
+
+def _model_template():
+    """Unfitted Prophet model with the configured parameters, built once per process"""
+    global _MODEL_TEMPLATE
+    if _MODEL_TEMPLATE is None:
+        _MODEL_TEMPLATE = Prophet(**PROPHET_PARAMS, stan_backend=STAN_BACKEND)
+    return _MODEL_TEMPLATE
+
 def train_prophet_model(train_data):
     """Train Prophet model"""
-    model = Prophet(**PROPHET_PARAMS)
+    # Copying the template skips input validation and Stan backend setup
+    model = copy.deepcopy(_model_template())
     model.fit(train_data)
     return model
 
-def evaluate_model(model, test_data):
-    """Evaluate model on test data"""
-    # Make predictions
-    future = model.make_future_dataframe(periods=len(test_data), freq='D')
-    forecast = model.predict(future)
+def evaluate_and_forecast(model, test_data, horizon=FORECAST_DAYS):
+    """Evaluate model on test data and generate future forecast"""
+    # Test period followed by the forecast horizon
+    future = model.make_future_dataframe(periods=len(test_data) + horizon, freq='D', include_history=False)
+    
+    # Metrics only need yhat, so skip interval sampling for the test period
+    uncertainty_samples = model.uncertainty_samples
+    model.uncertainty_samples = 0
+    try:
+        test_predictions = model.predict(future.iloc[:-horizon])[['ds', 'yhat']]
+    finally:
+        model.uncertainty_samples = uncertainty_samples
     
-    # Get test predictions
-    test_predictions = forecast.tail(len(test_data))
+    # Keep only the columns that are saved - predict returns every component
+    future_forecast = model.predict(future.iloc[-horizon:].reset_index(drop=True))[FORECAST_COLUMNS]
     
-    # Calculate metrics
-    mae = mean_absolute_error(test_data['y'], test_predictions['yhat'])
-    rmse = np.sqrt(mean_squared_error(test_data['y'], test_predictions['yhat']))
-    mape = np.mean(np.abs((test_data['y'] - test_predictions['yhat']) / test_data['y'])) * 100
-    r2 = r2_score(test_data['y'], test_predictions['yhat'])
+    # Calculate metrics on plain arrays so nothing aligns on index
+    y = test_data['y'].to_numpy()
+    yhat = test_predictions['yhat'].to_numpy()
+    errors = y - yhat
     
-    return {
+    mae = np.mean(np.abs(errors))
+    rmse = np.sqrt(np.mean(errors ** 2))
+    mape = np.mean(np.abs(errors / y)) * 100
+    r2 = r2_score(y, yhat)
+    
+    metrics = {
         'mae': mae,
         'rmse': rmse,
         'mape': mape,
         'r2': r2
     }
-
-def generate_forecast(model, periods=FORECAST_DAYS):
-    """Generate future forecast"""
-    future = model.make_future_dataframe(periods=periods, freq='D')
-    forecast = model.predict(future)
-    
-    # Get only future predictions
-    future_forecast = forecast.tail(periods).copy()
     
     # Resample to monthly for summary
-    future_forecast['month'] = pd.to_datetime(future_forecast['ds']).dt.to_period('M')
-    monthly_forecast = future_forecast.groupby('month')[['yhat', 'yhat_lower', 'yhat_upper']].mean()
+    monthly_forecast = (
+        future_forecast.set_index('ds')
+        .resample('MS')[['yhat', 'yhat_lower', 'yhat_upper']].mean()
+        .rename_axis('month')
+    )
     
-    return future_forecast, monthly_forecast
+    return metrics, future_forecast, monthly_forecast
 
 def save_model(model, market, grade):
     """Save trained model"""
@@ -135,7 +178,7 @@ def save_model(model, market, grade):
     filepath = MODELS_DIR / filename
     
     with open(filepath, 'wb') as f:
-        pickle.dump(model, f)
+        pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
     
     return filepath
 
@@ -145,18 +188,96 @@ def save_forecast(forecast_df, market, grade):
     filepath = FORECASTS_DIR / filename
     
     # Select relevant columns
-    forecast_output = forecast_df[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].copy()
-    forecast_output.columns = ['date', 'price_forecast', 'price_lower', 'price_upper']
+    forecast_output = forecast_df[FORECAST_COLUMNS].rename(columns=FORECAST_OUTPUT_COLUMNS)
     
     forecast_output.to_csv(filepath, index=False)
     
     return filepath
 
+def save_all_forecasts(forecasts):
+    """Save daily forecasts of every market-grade to one long-form CSV"""
+    filepath = FORECASTS_DIR / ALL_FORECASTS_FILENAME
+    
+    forecast_output = pd.concat(forecasts, ignore_index=True)
+    forecast_output = forecast_output[['market', 'grade', *FORECAST_COLUMNS]].rename(columns=FORECAST_OUTPUT_COLUMNS)
+    
+    forecast_output.to_csv(filepath, index=False)
+    
+    return filepath
+
+def _init_worker(template=None):
+    """Install the model template and warm up the Stan backend once per worker process"""
+    global _MODEL_TEMPLATE
+    _MODEL_TEMPLATE = template
+    
+    # Throwaway fit so the first real model doesn't pay for loading Stan
+    warmup = pd.DataFrame({'ds': pd.date_range('2000-01-01', periods=10, freq='D'), 'y': np.arange(10.0)})
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            Prophet(stan_backend=STAN_BACKEND, uncertainty_samples=0).fit(warmup)
+    except Exception:
+        # A failing backend will surface as a per-model error instead
+        pass
+
+def _train_one(args):
+    """Train, evaluate and save one market-grade model (runs in a worker)"""
+    data, market, grade = args
+    
+    try:
+        if len(data) < MIN_DATA_POINTS:
+            raise ValueError(f"Insufficient data: {len(data)} records (minimum: {MIN_DATA_POINTS})")
+        
+        # Train/test split
+        train_data, test_data = train_test_split_data(data)
+        
+        # Train, evaluate and forecast (silencing Prophet's warnings for these calls only)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            model = train_prophet_model(train_data)
+            metrics, future_forecast, monthly_forecast = evaluate_and_forecast(model, test_data)
+        
+        # Save model here so it never crosses the process boundary
+        model_path = save_model(model, market, grade)
+        forecast_path = save_forecast(future_forecast, market, grade) if SAVE_PER_MODEL_FORECASTS else None
+        
+    except Exception as e:
+        return {'market': market, 'grade': grade, 'status': 'FAILED', 'error': str(e)}
+    
+    monthly_forecast = monthly_forecast.reset_index()
+    monthly_forecast['market'] = market
+    monthly_forecast['grade'] = grade
+    
+    future_forecast['market'] = market
+    future_forecast['grade'] = grade
+    
+    return {
+        'market': market,
+        'grade': grade,
+        'status': 'SUCCESS',
+        'info': {
+            'market': market,
+            'grade': grade,
+            'records': len(data),
+            'train_size': len(train_data),
+            'test_size': len(test_data),
+            'metrics': metrics,
+            'avg_historical': data['y'].mean(),
+            'avg_forecast': future_forecast['yhat'].mean(),
+            'model_file': model_path.name,
+            'forecast_file': forecast_path.name if forecast_path else ALL_FORECASTS_FILENAME
+        },
+        'daily_forecast': future_forecast,
+        'monthly_forecast': monthly_forecast
+    }
+
 # MAIN TRAINING PIPELINE
 
 def train_all_models():
     """Train all market-grade models"""
     
+    init_config()
+    
     print_header("🌾 MAIZE PRICE PREDICTION - TRAINING ALL MODELS")
     
     start_time = datetime.now()
@@ -169,6 +290,7 @@ def train_all_models():
     models_data = {}
     training_log = []
     all_forecasts = []
+    daily_forecasts = []
     
     # Get all combinations
     combinations = [
@@ -179,34 +301,46 @@ def train_all_models():
     
     print_header(f" TRAINING {len(combinations)} PROPHET MODELS")
     
-    # Train each model
-    for idx, (market, grade) in enumerate(combinations, 1):
-        
-        combo_name = f"{market} - Grade {grade}"
-        
-        print(f"\n [{idx}/{len(combinations)}] {combo_name}")
-        print("-" * CONSOLE_WIDTH)
+    # Group once so workers only receive their own rows
+    groups = group_market_grade_data(df)
+    slices = {
+        (market, grade): prepare_market_grade_data(groups, market, grade)
+        for market, grade in combinations
+    }
+    
+    # Train models in parallel, one process per core
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                             initargs=(_model_template(),)) as executor:
+        futures = [
+            executor.submit(_train_one, (slices[(market, grade)], market, grade))
+            for market, grade in combinations
+        ]
         
-        try:
-            # Prepare data
-            data = prepare_market_grade_data(df, market, grade)
+        for idx, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            market, grade = result['market'], result['grade']
+            combo_name = f"{market} - Grade {grade}"
+            
+            print(f"\n [{idx}/{len(combinations)}] {combo_name}")
+            print("-" * CONSOLE_WIDTH)
             
-            if len(data) < MIN_DATA_POINTS:
-                raise ValueError(f"Insufficient data: {len(data)} records (minimum: {MIN_DATA_POINTS})")
+            if result['status'] == 'FAILED':
+                print(f"  Error: {result['error']}")
+                training_log.append({
+                    'market': market,
+                    'grade': grade,
+                    'status': 'FAILED',
+                    'error': result['error']
+                })
+                continue
             
-            print(f"    Records: {len(data)}")
+            data = slices[(market, grade)]
+            info = result['info']
+            metrics = info['metrics']
+            print(f"    Records: {info['records']}")
             print(f"    Range: {data['ds'].min()} to {data['ds'].max()}")
             print(f"    Price: {data['y'].min():.2f} - {data['y'].max():.2f} TZS")
-            
-            # Train/test split
-            train_data, test_data = train_test_split_data(data)
-            print(f"    Training on {len(train_data)} records, testing on {len(test_data)}...")
-            
-            # Train model
-            model = train_prophet_model(train_data)
-            
-            # Evaluate
-            metrics = evaluate_model(model, test_data)
+            print(f"    Training on {info['train_size']} records, testing on {info['test_size']}...")
             print(f"    MAE: {metrics['mae']:.2f} TZS")
             print(f"    RMSE: {metrics['rmse']:.2f} TZS")
             print(f"    MAPE: {metrics['mape']:.2f}%")
@@ -216,75 +350,55 @@ def train_all_models():
             if metrics['mape'] > MAX_ACCEPTABLE_MAPE:
                 print(f"  Warning: MAPE exceeds {MAX_ACCEPTABLE_MAPE}%")
             
-            # Generate forecast
-            future_forecast, monthly_forecast = generate_forecast(model)
-            print(f" 6-month forecast: Avg {future_forecast['yhat'].mean():.2f} TZS")
-            
-            # Save model
-            model_path = save_model(model, market, grade)
-            print(f"  Model saved: {model_path.name}")
-            
-            # Save forecast
-            forecast_path = save_forecast(future_forecast, market, grade)
-            print(f"  Forecast saved: {forecast_path.name}")
+            print(f" 6-month forecast: Avg {info['avg_forecast']:.2f} TZS")
+            print(f"  Model saved: {info['model_file']}")
+            if SAVE_PER_MODEL_FORECASTS:
+                print(f"  Forecast saved: {info['forecast_file']}")
             
             # Store results
-            models_data[combo_name] = {
-                'market': market,
-                'grade': grade,
-                'records': len(data),
-                'train_size': len(train_data),
-                'test_size': len(test_data),
-                'metrics': metrics,
-                'avg_historical': data['y'].mean(),
-                'avg_forecast': future_forecast['yhat'].mean(),
-                'model_file': model_path.name,
-                'forecast_file': forecast_path.name
-            }
-            
-            # Add to forecast collection
-            monthly_forecast_reset = monthly_forecast.reset_index()
-            monthly_forecast_reset['market'] = market
-            monthly_forecast_reset['grade'] = grade
-            all_forecasts.append(monthly_forecast_reset)
+            models_data[combo_name] = info
+            all_forecasts.append(result['monthly_forecast'])
+            daily_forecasts.append(result['daily_forecast'])
             
             # Training log
             training_log.append({
                 'market': market,
                 'grade': grade,
                 'status': 'SUCCESS',
-                'records': len(data),
+                'records': info['records'],
                 **metrics
             })
             
             print(f" Success!")
-            
-        except Exception as e:
-            print(f"  Error: {str(e)}")
-            training_log.append({
-                'market': market,
-                'grade': grade,
-                'status': 'FAILED',
-                'error': str(e)
-            })
     
     # SAVE SUMMARY FILES
 
     print_header(" SAVING SUMMARY FILES")
     
+    # Write every output in combination order, not completion order
+    order = {combo: idx for idx, combo in enumerate(combinations)}
+    all_forecasts.sort(key=lambda f: order[(f['market'].iat[0], f['grade'].iat[0])])
+    daily_forecasts.sort(key=lambda f: order[(f['market'].iat[0], f['grade'].iat[0])])
+    training_log.sort(key=lambda entry: order[(entry['market'], entry['grade'])])
+    models_data = dict(sorted(models_data.items(), key=lambda item: order[(item[1]['market'], item[1]['grade'])]))
+    
     # 1. Forecast summary CSV
     all_forecasts_df = pd.concat(all_forecasts, ignore_index=True)
     summary_file = FORECASTS_DIR / 'forecast_summary_all_markets.csv'
-    all_forecasts_df.to_csv(summary_file, index=False)
+    all_forecasts_df.to_csv(summary_file, index=False, date_format='%Y-%m')
     print(f" Forecast summary: {summary_file.name}")
     
-    # 2. Training log CSV
+    # 2. Daily forecasts CSV
+    daily_file = save_all_forecasts(daily_forecasts)
+    print(f" Daily forecasts: {daily_file.name}")
+    
+    # 3. Training log CSV
     log_df = pd.DataFrame(training_log)
     log_file = LOGS_DIR / f"price_training_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     log_df.to_csv(log_file, index=False)
     print(f" Training log: {log_file.name}")
     
-    # 3. Metadata JSON
+    # 4. Metadata JSON
     metadata = {
         'created_at': datetime.now().isoformat(),
         'model_type': 'Prophet',
@@ -361,6 +475,10 @@ def train_all_models():
 
 # VISUALIZATION FUNCTIONS
 
+def first_months(forecasts_df, count=6):
+    """Return the earliest forecast months"""
+    return np.sort(forecasts_df['month'].unique())[:count]
+
 def generate_visualizations(df, forecasts_df):
     """Generate all visualizations"""
     
@@ -386,87 +504,65 @@ def generate_visualizations(df, forecasts_df):
 def create_markets_grid(df, forecasts_df):
     """Create grid visualization of all markets (Grade A)"""
     
-    fig, axes = plt.subplots(4, 3, figsize=FIGURE_SIZE_GRID)
-    axes = axes.flatten()
+    # Historical and forecast prices in one long-form frame
+    historical = df.loc[df['quality_grade'] == 'A', ['market', 'date', 'price_per_kg_tzs']]
+    historical = historical.rename(columns={'price_per_kg_tzs': 'price'})
+    
+    forecast = forecasts_df.loc[forecasts_df['grade'] == 'A', ['market', 'month', 'yhat']]
+    forecast = forecast.rename(columns={'yhat': 'price'})
+    forecast['date'] = forecast.pop('month')
+    
+    tidy = pd.concat([
+        historical.assign(series='Historical'),
+        forecast.assign(series='Forecast')
+    ], ignore_index=True).sort_values(['market', 'series', 'date'])
+    
+    width, height = FIGURE_SIZE_GRID
+    g = sns.relplot(
+        data=tidy, x='date', y='price', hue='series', style='series',
+        col='market', col_order=MARKETS, col_wrap=3, kind='line',
+        height=height / 4, aspect=(width / 3) / (height / 4),
+        palette={'Historical': COLORS['train'], 'Forecast': COLORS['forecast']},
+        dashes={'Historical': '', 'Forecast': (4, 2)},
+        estimator=None, errorbar=None, facet_kws={'sharex': False, 'sharey': False}
+    )
     
-    for idx, market in enumerate(MARKETS):
-        ax = axes[idx]
-        
-        # Historical data
-        market_data = df[
-            (df['market'] == market) & 
-            (df['quality_grade'] == 'A')
-        ].sort_values('date')
-        
-        ax.plot(market_data['date'], market_data['price_per_kg_tzs'], 
-                color=COLORS['train'], linewidth=1.5, alpha=0.7, label='Historical')
-        
-        # Forecast data
-        forecast_data = forecasts_df[
-            (forecasts_df['market'] == market) & 
-            (forecasts_df['grade'] == 'A')
-        ]
-        
-        if len(forecast_data) > 0:
-            forecast_dates = pd.to_datetime(forecast_data['month'].astype(str))
-            ax.plot(forecast_dates, forecast_data['yhat'], 
-                    color=COLORS['forecast'], linewidth=2, linestyle='--', 
-                    marker='o', label='Forecast')
-        
-        ax.set_title(f"{market}\nGrade A", fontsize=10, fontweight='bold')
-        ax.set_xlabel('Date', fontsize=8)
-        ax.set_ylabel('Price (TZS/kg)', fontsize=8)
-        ax.legend(fontsize=7)
+    g.set_titles("{col_name}\nGrade A", size=10, fontweight='bold')
+    g.set_axis_labels('Date', 'Price (TZS/kg)', fontsize=8)
+    g.legend.set_title(None)
+    for ax in g.axes.flat:
         ax.grid(True, alpha=0.3)
         ax.tick_params(labelsize=7)
     
-    plt.suptitle('6-Month Price Forecast - All Markets (Grade A)', 
-                 fontsize=16, fontweight='bold', y=0.995)
-    plt.tight_layout()
+    g.figure.suptitle('6-Month Price Forecast - All Markets (Grade A)', 
+                      fontsize=16, fontweight='bold')
+    # Lay out once with the final titles, leaving room for the suptitle,
+    # so the saved figure needs no tight bbox
+    g.tight_layout()
+    g.figure.subplots_adjust(top=0.93)
     
+    # FacetGrid.savefig defaults to a tight bbox, which redraws the figure
     filename = get_visualization_filename('all_markets_grid_grade_a')
-    plt.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI, bbox_inches='tight')
-    plt.close()
+    g.figure.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI)
+    plt.close(g.figure)
 
 def create_grade_comparison(forecasts_df):
     """Create grade comparison bar chart"""
     
-    fig, ax = plt.subplots(figsize=(16, 8))
-    
-    # Calculate average forecast by grade across all markets
-    grade_averages = []
-    for grade in QUALITY_GRADES:
-        grade_data = forecasts_df[forecasts_df['grade'] == grade]
-        avg_forecast = grade_data['yhat'].mean()
-        grade_averages.append(avg_forecast)
-    
-    # Get first 6 months
-    months = forecasts_df['month'].unique()[:6]
-    month_labels = [pd.Period(m).strftime('%b %Y') for m in months]
-    
-    # Prepare data for each grade
-    grade_a_data = []
-    grade_b_data = []
-    grade_c_data = []
-    
-    for month in months:
-        grade_a_data.append(
-            forecasts_df[(forecasts_df['month'] == month) & (forecasts_df['grade'] == 'A')]['yhat'].mean()
-        )
-        grade_b_data.append(
-            forecasts_df[(forecasts_df['month'] == month) & (forecasts_df['grade'] == 'B')]['yhat'].mean()
-        )
-        grade_c_data.append(
-            forecasts_df[(forecasts_df['month'] == month) & (forecasts_df['grade'] == 'C')]['yhat'].mean()
-        )
+    fig, ax = plt.subplots(figsize=(16, 8), constrained_layout=True)
+    
+    # Average forecast per month and grade across all markets (first 6 months)
+    recent = forecasts_df[forecasts_df['month'].isin(first_months(forecasts_df))]
+    pivot = recent.groupby(['month', 'grade'])['yhat'].mean().unstack('grade')
+    month_labels = pivot.index.strftime('%b %Y')
     
     # Plot
     x = np.arange(len(month_labels))
     width = 0.25
     
-    ax.bar(x - width, grade_a_data, width, label='Grade A', color=COLORS['grade_a'])
-    ax.bar(x, grade_b_data, width, label='Grade B', color=COLORS['grade_b'])
-    ax.bar(x + width, grade_c_data, width, label='Grade C', color=COLORS['grade_c'])
+    for offset, grade in enumerate(QUALITY_GRADES, -1):
+        ax.bar(x + offset * width, pivot[grade], width, 
+               label=f'Grade {grade}', color=COLORS[f'grade_{grade.lower()}'])
     
     ax.set_xlabel('Month', fontsize=12, fontweight='bold')
     ax.set_ylabel('Average Price (TZS/kg)', fontsize=12, fontweight='bold')
@@ -477,17 +573,16 @@ def create_grade_comparison(forecasts_df):
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    
-    filename = get_visualization_filename('grade_comparison')
-    plt.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI, bbox_inches='tight')
-    plt.close()
+    filename = get_visualization_filename('grade_comparison', VECTOR_PLOT_FORMAT)
+    fig.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI)
+    plt.close(fig)
 
 def create_forecast_heatmap(forecasts_df):
     """Create heatmap of forecasts"""
     
-    # Filter to Grade A for clarity
-    grade_a = forecasts_df[forecasts_df['grade'] == 'A'].copy()
+    # Filter to Grade A for clarity, first 6 months only
+    grade_a = forecasts_df[forecasts_df['grade'] == 'A']
+    grade_a = grade_a[grade_a['month'].isin(first_months(grade_a))]
     
     # Pivot table
     pivot_data = grade_a.pivot_table(
@@ -496,14 +591,11 @@ def create_forecast_heatmap(forecasts_df):
         columns='month'
     )
     
-    # Select first 6 months
-    pivot_data = pivot_data.iloc[:, :6]
-    
     # Rename columns
-    pivot_data.columns = [pd.Period(col).strftime('%b %Y') for col in pivot_data.columns]
+    pivot_data.columns = pivot_data.columns.strftime('%b %Y')
     
     # Plot
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = plt.subplots(figsize=(14, 8), constrained_layout=True)
     sns.heatmap(pivot_data, annot=True, fmt='.0f', cmap='RdYlGn', 
                 cbar_kws={'label': 'Price (TZS/kg)'}, ax=ax)
     
@@ -512,11 +604,9 @@ def create_forecast_heatmap(forecasts_df):
     ax.set_xlabel('Month', fontsize=12)
     ax.set_ylabel('Market', fontsize=12)
     
-    plt.tight_layout()
-    
-    filename = get_visualization_filename('forecast_heatmap_grade_a')
-    plt.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI, bbox_inches='tight')
-    plt.close()
+    filename = get_visualization_filename('forecast_heatmap_grade_a', VECTOR_PLOT_FORMAT)
+    fig.savefig(VISUALIZATIONS_DIR / filename, dpi=PLOT_DPI)
+    plt.close(fig)
 
 # MAIN EXECUTION
 
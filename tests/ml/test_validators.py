@@ -0,0 +1,31 @@
+"""
+Tests for the analytics data validators
+"""
+
+import sys
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# validators.py imports its config as a top-level module
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'ml' / 'analytics'))
+
+from validators import validate_production_data
+
+
+def test_production_all_missing_quantities_reports_missing_only():
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2024-01-01', '2024-02-01', '2024-03-01']),
+        'region': ['Mbeya', 'Iringa', 'Ruvuma'],
+        'quantity_tons': [np.nan, np.nan, np.nan]
+    })
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = validate_production_data(df, now=datetime(2024, 6, 1))
+
+    assert result.errors == ["Column 'quantity_tons' has 100.0% missing values"]
+    assert not any('outliers' in warning for warning in result.warnings)